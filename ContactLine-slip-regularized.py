@@ -112,9 +112,9 @@ def theta_cubed_analytical(x):
     """
     Analytical approximation for θ³ = (dh/dx)³.
 
-    θ³ = 1 + 0.03*ln(e*x)
+    θ³ = 1 + 0.03*ln(e*x) = 1 + 0.03*(1 + ln(x))
     """
-    return 1 + 0.03 * np.log(np.e * x)
+    return 1 + 0.03 * (1 + np.log(x))
 
 
 def theta_analytical(x):
@@ -159,7 +159,7 @@ x_mesh = np.logspace(np.log10(x_start), np.log10(x_end), N_points)
 # q (d²h/dx²): small negative values, goes to 0 at far field
 y_guess = np.zeros((3, x_mesh.size))
 y_guess[0, :] = x_mesh  # h ≈ x for small x
-theta_cubed_guess = 1 + 0.03 * np.log(np.e * x_mesh)
+theta_cubed_guess = 1 + 0.03 * (1 + np.log(x_mesh))
 y_guess[1, :] = theta_cubed_guess ** (1 / 3)  # h' = θ = (θ³)^(1/3)
 y_guess[2, :] = np.linspace(-0.01, 0.0, N_points)  # h'' guess
 
@@ -268,7 +268,7 @@ ax2.set_xlim([1e-3, 1e4])
 ax2.set_ylim([1e-8, None])  # Set y minimum to 1e-8
 
 plt.tight_layout()
-plt.savefig("ContactLine-slip.pdf", dpi=300, bbox_inches="tight")
+plt.savefig("ContactLine-slip.pdf", dpi=150)
 print("\nSaved: ContactLine-slip.pdf")
 
 plt.show()
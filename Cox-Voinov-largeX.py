@@ -15,8 +15,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import rc
 
-# Enable LaTeX rendering
-rc('text', usetex=True)
+# Render labels with matplotlib's built-in mathtext in Computer Modern,
+# which avoids spawning latex/dvipng for every label
+rc('text', usetex=False)
+rc('mathtext', fontset='cm')
 rc('font', family='serif', size=16)
 rc('axes', labelsize=18, titlesize=18)
 rc('legend', fontsize=16)
@@ -24,9 +26,29 @@ rc('xtick', labelsize=14)
 rc('ytick', labelsize=14)
 
 
+def theta_cubed_from_log(log_x):
+    """
+    Calculate θ³ = 1 + 0.03*(1 + ln(x)) from precomputed ln(x)
+
+    Parameters
+    ----------
+    log_x : array_like
+        Natural logarithm of the input values
+
+    Returns
+    -------
+    array_like
+        θ³ values
+    """
+    t3 = log_x + 1
+    t3 *= 0.03
+    t3 += 1
+    return t3
+
+
 def theta_cubed(x):
     """
-    Calculate θ³ = 1 + 0.03*ln(e*x)
+    Calculate θ³ = 1 + 0.03*ln(e*x) = 1 + 0.03*(1 + ln(x))
 
     Parameters
     ----------
@@ -38,7 +60,7 @@ def theta_cubed(x):
     array_like
         θ³ values
     """
-    return 1 + 0.03 * np.log(np.e * x)
+    return theta_cubed_from_log(np.log(x))
 
 
 def theta(x):
@@ -55,7 +77,7 @@ def theta(x):
     array_like
         θ values
     """
-    return theta_cubed(x)**(1/3)
+    return np.cbrt(theta_cubed(x))
 
 
 def dtheta_dx(x):
@@ -72,8 +94,38 @@ def dtheta_dx(x):
     array_like
         dθ/dx values
     """
-    theta_val = theta(x)
-    return 0.01 / (x * theta_val**2)
+    return theta_cubed_and_deriv(x)[1]
+
+
+def theta_cubed_and_deriv(x, t3=None):
+    """
+    Calculate θ³ and dθ/dx together, evaluating the logarithm only once.
+
+    Uses θ² = (θ³)^(2/3), so dθ/dx = 0.01/(x*cbrt((θ³)²)).
+
+    Parameters
+    ----------
+    x : array_like
+        Input values (must be positive)
+    t3 : array_like, optional
+        Precomputed θ³ values at x; computed from x if omitted
+
+    Returns
+    -------
+    tuple of array_like
+        (θ³, dθ/dx) values
+    """
+    if t3 is None:
+        t3 = theta_cubed(x)
+
+    # dθ/dx built in a single buffer, without intermediate arrays
+    dt = np.empty_like(t3, dtype=float)
+    np.multiply(t3, t3, out=dt)
+    np.cbrt(dt, out=dt)
+    dt *= x
+    np.reciprocal(dt, out=dt)
+    dt *= 0.01
+    return t3, dt[()]    # [()] unwraps 0-d results back to a scalar
 
 
 # ============================================================================
@@ -84,8 +136,7 @@ def dtheta_dx(x):
 x_linear = np.linspace(0.01, 1000, 2000)
 
 # Calculate function values
-theta_cubed_linear = theta_cubed(x_linear)
-dtheta_linear = dtheta_dx(x_linear)
+theta_cubed_linear, dtheta_linear = theta_cubed_and_deriv(x_linear)
 
 # Create figure with two subplots
 fig1, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
@@ -110,19 +161,20 @@ ax2.set_xlim([0, 1000])
 ax2.set_ylim([0, max(dtheta_linear) * 1.1])
 
 plt.tight_layout()
-plt.savefig('Cox-Voinov-largeX_linear.pdf', dpi=300, bbox_inches='tight')
+plt.savefig('Cox-Voinov-largeX_linear.pdf', dpi=150)
 print("Saved: Cox-Voinov-largeX_linear.pdf")
 
 # ============================================================================
 # Figure 2: Log-log scale plots
 # ============================================================================
 
-# Create x values for log scale
-x_log = np.logspace(-3, 5, 2000)
+# Create x values for log scale, x = 10^t
+t_log = np.linspace(-3, 5, 2000)
+x_log = 10.0**t_log
 
-# Calculate function values
-theta_cubed_log = theta_cubed(x_log)
-dtheta_log = dtheta_dx(x_log)
+# Calculate function values; on this grid ln(x) = t*ln(10), so no log is needed
+theta_cubed_log = theta_cubed_from_log(t_log * np.log(10))
+theta_cubed_log, dtheta_log = theta_cubed_and_deriv(x_log, theta_cubed_log)
 
 # Create figure with two subplots
 fig2, (ax3, ax4) = plt.subplots(1, 2, figsize=(12, 5))
@@ -146,7 +198,7 @@ ax4.legend(loc='best')
 ax4.set_xlim([1e-3, 1e5])
 
 plt.tight_layout()
-plt.savefig('Cox-Voinov-largeX_loglog.pdf', dpi=300, bbox_inches='tight')
+plt.savefig('Cox-Voinov-largeX_loglog.pdf', dpi=150)
 print("Saved: Cox-Voinov-largeX_loglog.pdf")
 
 plt.show()
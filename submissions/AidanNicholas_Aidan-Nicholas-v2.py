@@ -88,7 +88,7 @@ axs_linear[1].set_title("Second Derivative")
 axs_linear[1].grid(True, which="both", alpha=0.3)
 
 plt.tight_layout()
-plt.savefig("AidanNicholas_LinearLinearPlot.png", dpi=300)
+plt.savefig("AidanNicholas_LinearLinearPlot.png", dpi=150)
 
 fig, axs = plt.subplots(1, 2, sharex=False, figsize=(14, 5))
 
@@ -139,5 +139,5 @@ axs[1].grid(True, which="both", alpha=0.3)
 axs[1].legend()
 
 plt.tight_layout()
-plt.savefig("AidanNicholas_LogLogPLot.png", dpi=300)
+plt.savefig("AidanNicholas_LogLogPLot.png", dpi=150)
 plt.show()
@@ -19,6 +19,9 @@ import os
 def ode_rhs(x, h):
     return -0.01 / (h**2 + h)
 
+def ode_jac(x, h):
+    return np.array([[0.01 * (2*h[0] + 1) / (h[0]**2 + h[0])**2]])
+
 def h_prime(h):
     return -0.01 / (h**2 + h)
 
@@ -29,17 +32,20 @@ def h_double_prime(h):
 x_start = 0.0
 x_end = 50.0
 h0 = 1.0
+x_plot = np.linspace(x_start, x_end, 1000)
 
 sol = solve_ivp(
     fun=ode_rhs,
     t_span=(x_start, x_end),
     y0=[h0],
-    dense_output=True,
-    max_step=0.1
+    method="LSODA",
+    jac=ode_jac,
+    t_eval=x_plot,
+    rtol=1e-6,
+    atol=1e-9
 )
 
-x_plot = np.linspace(x_start, x_end, 1000)
-h_vals = sol.sol(x_plot)[0]
+h_vals = sol.y[0]
 hprime_vals = h_prime(h_vals)
 h2prime_vals = h_double_prime(h_vals)
 
@@ -63,7 +69,7 @@ plt.tight_layout()
 script_dir = os.path.dirname(os.path.abspath(__file__))
 
 plot_path = os.path.join(script_dir, "solution_plot.png")
-plt.savefig(plot_path, dpi=300)
+plt.savefig(plot_path, dpi=150)
 print(f"Plot saved to: {plot_path}")
 
 data_path = os.path.join(script_dir, "h_data.csv")
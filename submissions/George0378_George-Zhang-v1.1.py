@@ -39,11 +39,15 @@ eps = 1e-6      # small regularisation to avoid division by zero at h=0
 #          We add a small eps to the denominator so h=0 is not singular.
 def ode_system(x, y):
     h = y[0]
-    denom = h**2 + h + eps              # CHANGED: regularised denominator
-    d3h_dx3 = -0.01 / denom
-    return np.vstack((y[1],            # y0' = y1
-                      y[2],            # y1' = y2
-                      d3h_dx3))        # y2' = d^3h/dx^3
+    dydx = np.empty_like(y)
+    dydx[0] = y[1]                      # y0' = y1
+    dydx[1] = y[2]                      # y1' = y2
+    # y2' = d^3h/dx^3, built in place in the output row
+    np.add(h, 1.0, out=dydx[2])         # h^2 + h + eps = h*(h + 1) + eps
+    dydx[2] *= h
+    dydx[2] += eps                      # CHANGED: regularised denominator
+    np.divide(-0.01, dydx[2], out=dydx[2])
+    return dydx
 
 
 # ---------------------------------------------------------------------
@@ -80,9 +84,9 @@ if sol.status != 0:
     print("WARNING: BVP solver did not converge. Message:")
     print(sol.message)
 
-# Create a fine grid for plotting
-x_plot = np.linspace(0.0, L, 1000)
-y_plot = sol.sol(x_plot)
+# Plot on the solver's own (adaptively refined) mesh
+x_plot = sol.x
+y_plot = sol.y
 h_vals = y_plot[0]
 h_prime_vals = y_plot[1]    # h'(x)
 h_2prime_vals = y_plot[2]   # h''(x)
@@ -106,6 +110,6 @@ ax2.set_ylabel("h''(x)")
 ax2.grid(True)
 
 plt.tight_layout()
-plt.savefig("hprime_h2prime_linear.png", dpi=300)
+plt.savefig("hprime_h2prime_linear.png", dpi=150)
 plt.show()
 
@@ -88,9 +88,8 @@ if sol.status != 0:
 
 # Evaluated solution
 x_plot = np.linspace(0, L, 1000)
-h      = sol.sol(x_plot)[0]
-h_p    = sol.sol(x_plot)[1]
-h_pp   = sol.sol(x_plot)[2]
+y_plot = sol.sol(x_plot)   # one interpolant evaluation for all components
+h, h_p, h_pp = y_plot[0], y_plot[1], y_plot[2]
 
 
 # ---------------------------------------------------------------------
@@ -148,6 +147,6 @@ bx2.set_ylabel("|h''(x)| (log scale)")
 bx2.grid(True, which='both')
 
 plt.tight_layout()
-plt.savefig("hprime_h2prime_loglog.png", dpi=300)
+plt.savefig("hprime_h2prime_loglog.png", dpi=150)
 plt.show()
 
@@ -48,11 +48,15 @@ eps = 1e-6 # Regularisation so denominator doesn't blow up at h=0
 #   y2' = -0.01 / (h^2 + h + eps)
 def ode_system(x, y):
     h = y[0]
-    denom = h**2 + h + eps
-    d3h = -0.01 / denom
-    return np.vstack((y[1],    # h'
-                      y[2],    # h''
-                      d3h))    # h'''
+    dydx = np.empty_like(y)
+    dydx[0] = y[1]             # h'
+    dydx[1] = y[2]             # h''
+    # h''' = -0.01 / (h^2 + h + eps), built in place in the output row
+    np.add(h, 1.0, out=dydx[2])    # h^2 + h + eps = h*(h + 1) + eps
+    dydx[2] *= h
+    dydx[2] += eps
+    np.divide(-0.01, dydx[2], out=dydx[2])
+    return dydx
 
 
 # ---------------------------------------------------------------------
@@ -69,7 +73,9 @@ def bc(ya, yb):
 # ---------------------------------------------------------------------
 # Initial mesh and crude initial guess
 # ---------------------------------------------------------------------
-x_init = np.linspace(0, L, 200)
+# Cluster nodes in [0, 1], where 1/(h^2 + h) varies fastest near h = 0
+x_init = np.concatenate([np.linspace(0, 1, 50),
+                         np.linspace(1, L, 250)[1:]])
 
 y_init = np.zeros((3, x_init.size))
 y_init[0] = x_init         # guess: h(x) ≈ x
@@ -86,11 +92,11 @@ if sol.status != 0:
     print("WARNING: solve_bvp did not fully converge:")
     print(sol.message)
 
-# Evaluated solution
-x_plot = np.linspace(0, L, 1000)
-h      = sol.sol(x_plot)[0]
-h_p    = sol.sol(x_plot)[1]
-h_pp   = sol.sol(x_plot)[2]
+# Solution on the solver's own (adaptively refined) mesh
+x_plot = sol.x
+h      = sol.y[0]
+h_p    = sol.y[1]
+h_pp   = sol.y[2]
 
 
 # ---------------------------------------------------------------------
@@ -148,6 +154,6 @@ bx2.set_ylabel("|h''(x)| (log scale)")
 bx2.grid(True, which='both')
 
 plt.tight_layout()
-plt.savefig("hprime_h2prime_loglog.png", dpi=300)
+plt.savefig("hprime_h2prime_loglog.png", dpi=150)
 plt.show()
 
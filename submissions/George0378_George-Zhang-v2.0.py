@@ -22,7 +22,13 @@ from scipy.integrate import solve_bvp
 
 def ode_system(x, y):
     h = y[0]
-    return np.vstack((y[1], y[2], -0.01 / (h**2 + h)))
+    dydx = np.empty_like(y)
+    dydx[0] = y[1]
+    dydx[1] = y[2]
+    np.add(h, 1.0, out=dydx[2])
+    dydx[2] *= h
+    np.divide(-0.01, dydx[2], out=dydx[2])
+    return dydx
 
 
 def boundary_conditions(ya, yb):
@@ -34,7 +40,7 @@ def boundary_conditions(ya, yb):
 
 
 def theta_cubed_analytical(x):
-    return 1.0 + 0.03 * np.log(np.e * x)
+    return 1.0 + 0.03 * (1.0 + np.log(x))
 
 
 def dtheta_dx_analytical(x):
@@ -65,8 +71,9 @@ solution = solve_bvp(
 if not solution.success:
     print("WARNING:", solution.message)
 
-x_plot = np.logspace(np.log10(x_plot_start), np.log10(x_plot_end), 1000)
-h, theta, dtheta_dx = solution.sol(x_plot)
+plot_mask = (solution.x >= x_plot_start) & (solution.x <= x_plot_end)
+x_plot = solution.x[plot_mask]
+h, theta, dtheta_dx = solution.y[:, plot_mask]
 
 theta_cubed = theta**3
 theta_cubed_exact = theta_cubed_analytical(x_plot)
@@ -107,7 +114,7 @@ ax2.grid(True, alpha=0.3, which="both")
 ax2.legend()
 
 plt.tight_layout()
-plt.savefig("George0378_loglogplot.png", dpi=300)
+plt.savefig("George0378_loglogplot.png", dpi=150)
 
 fig_linear, (bx1, bx2) = plt.subplots(2, 1, figsize=(8, 6), sharex=True)
 bx1.plot(x_plot, theta, "r-", linewidth=2)
@@ -124,5 +131,5 @@ bx2.set_title("Second Derivative")
 bx2.grid(True, alpha=0.3, which="both")
 
 plt.tight_layout()
-plt.savefig("George0378_linear.png", dpi=300)
+plt.savefig("George0378_linear.png", dpi=150)
 plt.show()